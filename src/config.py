@@ -1,5 +1,7 @@
 """Application configuration loaded from environment variables."""
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -15,6 +17,17 @@ class Settings(BaseSettings):
     app_name: str = "Task Manager API"
     debug: bool = False
     database_url: str = "sqlite+aiosqlite:///./tasks.db"
+    database_pool_size: int = 25
+    database_max_overflow: int = 25
+    database_pool_timeout: float = 30.0
+    database_pool_recycle: int = 1800
+    database_pool_pre_ping: bool = True
+    database_pool_use_lifo: bool = True
+    database_pgbouncer: bool = False
+    redis_url: str | None = None
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings, reading the environment and .env once."""
+    return Settings()
@@ -1,73 +1,158 @@
 """CRUD operations for the Task resource."""
 
-from sqlalchemy import select
+from typing import Any
+
+from sqlalchemy import Row, bindparam, delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .models import Task
-from .schemas import TaskCreate, TaskUpdate
-
-
-async def get_task(db: AsyncSession, task_id: int) -> Task | None:
+from .schemas import TaskCreate, TaskResponseStruct, TaskUpdate
+
+# Statements are built once at import and parameterised per call, so each
+# request skips rebuilding the expression tree before the compile-cache lookup.
+_tasks = Task.__table__
+
+# List queries select exactly TaskResponseStruct's fields, in its order, so the
+# list endpoint can unpack each row positionally whatever the table's layout.
+_LIST_COLUMNS = tuple(_tasks.c[name] for name in TaskResponseStruct.__struct_fields__)
+
+_GET_BY_ID = select(_tasks).where(_tasks.c.id == bindparam("task_id"))
+_LIST_ALL = (
+    select(*_LIST_COLUMNS)
+    .order_by(_tasks.c.id)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+_LIST_BY_COMPLETED = (
+    select(*_LIST_COLUMNS)
+    .where(_tasks.c.completed == bindparam("completed"))
+    .order_by(_tasks.c.id)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+_LIST_AFTER = (
+    select(*_LIST_COLUMNS)
+    .where(_tasks.c.id > bindparam("after_id"))
+    .order_by(_tasks.c.id)
+    .limit(bindparam("limit"))
+)
+_LIST_BY_COMPLETED_AFTER = (
+    select(*_LIST_COLUMNS)
+    .where(_tasks.c.completed == bindparam("completed"))
+    .where(_tasks.c.id > bindparam("after_id"))
+    .order_by(_tasks.c.id)
+    .limit(bindparam("limit"))
+)
+_UPDATE_BY_ID = (
+    update(Task)
+    .where(Task.id == bindparam("task_id"))
+    .returning(Task)
+    .execution_options(populate_existing=True)
+)
+_DELETE_BY_ID = delete(Task).where(Task.id == bindparam("task_id")).returning(Task.id)
+
+
+async def get_task(db: AsyncSession, task_id: int) -> Row[Any] | None:
     """Fetch a single task by its primary key.
 
-    Returns the Task instance or None if not found.
+    Like get_tasks, this reads a plain Core row rather than an ORM instance.
+    Returns the task row or None if not found.
     """
-    result = await db.execute(select(Task).where(Task.id == task_id))
-    return result.scalar_one_or_none()
+    result = await db.execute(_GET_BY_ID, {"task_id": task_id})
+    return result.one_or_none()
 
 
 async def get_tasks(
-    db: AsyncSession, skip: int = 0, limit: int = 100, completed: bool | None = None
-) -> list[Task]:
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    completed: bool | None = None,
+    after_id: int | None = None,
+) -> list[Row[Any]]:
     """Fetch a paginated list of tasks with optional status filter.
 
+    Results are ordered by ID. When after_id is given, keyset pagination is
+    used (rows with a greater ID) and skip is ignored, avoiding the cost of
+    scanning past skipped rows on large tables.
+
+    The query selects TaskResponseStruct's columns directly, in field order, so
+    rows come back as plain Core rows without building ORM instances and can
+    be unpacked positionally into the struct.
+
     Args:
         db: The async database session.
         skip: Number of records to skip (offset).
         limit: Maximum number of records to return.
         completed: Optional filter by completion status. None returns all tasks.
+        after_id: Optional keyset cursor; only tasks with a greater ID are
+            returned.
 
     Returns:
-        List of Task instances matching the criteria.
+        List of task rows matching the criteria.
     """
-    query = select(Task)
+    params: dict[str, Any] = {"limit": limit}
+    if after_id is not None:
+        params["after_id"] = after_id
+        stmt = _LIST_AFTER if completed is None else _LIST_BY_COMPLETED_AFTER
+    else:
+        params["skip"] = skip
+        stmt = _LIST_ALL if completed is None else _LIST_BY_COMPLETED
     if completed is not None:
-        query = query.where(Task.completed == completed)
-    query = query.offset(skip).limit(limit)
-    result = await db.execute(query)
-    return list(result.scalars().all())
+        params["completed"] = completed
+    result = await db.execute(stmt, params)
+    return list(result.all())
 
 
 async def create_task(db: AsyncSession, task: TaskCreate) -> Task:
-    """Persist a new task and return the instance with all DB-generated fields."""
-    db_task = Task(**task.model_dump())
-    db.add(db_task)
-    await db.flush()
-    await db.refresh(db_task)
-    return db_task
+    """Persist a new task and return the instance with all DB-generated fields.
+
+    Uses INSERT ... RETURNING so the generated id and timestamps come back in
+    the same round trip as the insert.
+    """
+    values = {field: getattr(task, field) for field in TaskCreate.write_fields}
+    stmt = insert(Task).values(**values).returning(Task)
+    result = await db.execute(stmt)
+    return result.scalar_one()
+
+
+async def create_tasks(db: AsyncSession, tasks: list[TaskCreate]) -> list[Task]:
+    """Persist several tasks in one statement and return them in input order.
+
+    The rows are sent as a single executemany INSERT ... RETURNING, which
+    SQLAlchemy batches into multi-row VALUES clauses; sort_by_parameter_order
+    keeps the returned tasks aligned with the request.
+    """
+    values = [
+        {field: getattr(task, field) for field in TaskCreate.write_fields}
+        for task in tasks
+    ]
+    stmt = insert(Task).returning(Task, sort_by_parameter_order=True)
+    result = await db.scalars(stmt, values)
+    return list(result.all())
 
 
 async def update_task(
     db: AsyncSession, task_id: int, task_update: TaskUpdate
-) -> Task | None:
+) -> Task | Row[Any] | None:
     """Apply a partial update to an existing task.
 
-    Only fields explicitly set in task_update are written to the database.
-    Returns the updated Task, or None if the task does not exist.
+    Only fields explicitly set in task_update are written to the database,
+    using a single UPDATE ... RETURNING. An empty update falls back to a plain
+    read-only lookup and returns its row. Returns the updated task, or None if
+    the task does not exist.
     """
-    db_task = await get_task(db, task_id)
-    if db_task is None:
-        return None
-
-    for field, value in task_update.model_dump(exclude_unset=True).items():
-        setattr(db_task, field, value)
-
-    await db.flush()
-    await db.refresh(db_task)
-    return db_task
+    values = {
+        field: getattr(task_update, field)
+        for field in task_update.model_fields_set & TaskUpdate.write_fields
+    }
+    if not values:
+        return await get_task(db, task_id)
+
+    result = await db.execute(_UPDATE_BY_ID.values(**values), {"task_id": task_id})
+    return result.scalar_one_or_none()
 
 
-async def delete_task(db: AsyncSession, task_id: int) -> Task | None:
+async def delete_task(db: AsyncSession, task_id: int) -> int | None:
     """Delete a task by ID.
 
     Args:
@@ -75,10 +160,7 @@ async def delete_task(db: AsyncSession, task_id: int) -> Task | None:
         task_id: The ID of the task to delete.
 
     Returns:
-        The deleted Task instance, or None if the task does not exist.
+        The ID of the deleted task, or None if the task does not exist.
     """
-    db_task = await get_task(db, task_id)
-    if db_task is None:
-        return None
-    await db.delete(db_task)
-    return db_task
+    result = await db.execute(_DELETE_BY_ID, {"task_id": task_id})
+    return result.scalar_one_or_none()
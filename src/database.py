@@ -1,29 +1,138 @@
 """Async SQLAlchemy engine, session factory, and declarative base."""
 
+import asyncio
 from collections.abc import AsyncGenerator
+from typing import Any
+from uuid import uuid4
 
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, StaticPool
 
-from .config import settings
+from .config import get_settings
 
-engine = create_async_engine(settings.database_url, echo=settings.debug)
+
+def _engine_options(database_url: str) -> dict[str, Any]:
+    """Build create_async_engine keyword arguments for the given database URL.
+
+    SQLite gets no pool sizing: file databases keep the dialect's default pool
+    and in-memory databases share a single connection via StaticPool. Server
+    backends (PostgreSQL, MySQL) get a pool sized from settings, checked out
+    LIFO by default so the most recently used connections stay warm.
+
+    With database_pgbouncer set, asyncpg URLs instead get NullPool and no
+    statement caching, leaving pooling to a transaction-mode pgbouncer.
+
+    Raises:
+        ValueError: If the URL selects the synchronous psycopg2 driver.
+    """
+    settings = get_settings()
+    url = make_url(database_url)
+    if url.get_driver_name() == "psycopg2":
+        raise ValueError(
+            "psycopg2 is a synchronous driver; use postgresql+asyncpg:// instead."
+        )
+
+    options: dict[str, Any] = {}
+    # Only pass echo flags in debug so production engines get no logging setup.
+    if settings.debug:
+        options["echo"] = True
+        options["echo_pool"] = "debug"
+
+    if url.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+        if url.database in (None, "", ":memory:"):
+            options["poolclass"] = StaticPool
+        return options
+
+    if url.get_driver_name() == "asyncpg" and settings.database_pgbouncer:
+        # Transaction pooling hands each transaction any server connection, so
+        # prepared statements must neither be cached nor reuse asyncpg's
+        # sequential __asyncpg_stmt_N__ names, which collide across clients.
+        options["poolclass"] = NullPool
+        options["connect_args"] = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+        return options
+
+    options.update(
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+        pool_recycle=settings.database_pool_recycle,
+        pool_pre_ping=settings.database_pool_pre_ping,
+        pool_use_lifo=settings.database_pool_use_lifo,
+    )
+    if url.get_driver_name() == "asyncpg":
+        options["poolclass"] = AsyncAdaptedQueuePool
+    return options
+
+
+_database_url = get_settings().database_url
+engine = create_async_engine(_database_url, **_engine_options(_database_url))
 
 AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
 
+# Shares the engine's pool; connections checked out through it run in
+# autocommit mode, so read-only requests send no BEGIN/COMMIT.
+ReadOnlySessionLocal = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"), expire_on_commit=False
+)
+
+
+async def warm_up_pool(db_engine: AsyncEngine, size: int) -> None:
+    """Open size connections concurrently and return them to the pool.
+
+    Pays connection handshakes at startup instead of on the first burst of
+    requests. SQLite is skipped since it has no network handshake, and NullPool
+    since it keeps no connections to warm.
+    """
+    if (
+        db_engine.dialect.name == "sqlite"
+        or isinstance(db_engine.pool, NullPool)
+        or size <= 0
+    ):
+        return
+    results = await asyncio.gather(
+        *(db_engine.connect() for _ in range(size)), return_exceptions=True
+    )
+    # Release every connection that did open before surfacing a failure, so a
+    # partial warm-up does not leak them.
+    await asyncio.gather(
+        *(conn.close() for conn in results if not isinstance(conn, BaseException))
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
 
 class Base(DeclarativeBase):
     """Shared declarative base for all ORM models."""
 
 
+async def get_engine() -> AsyncEngine:
+    """FastAPI dependency returning the application engine.
+
+    For routes that open their own connections only when needed, rather than
+    taking a session for the whole request.
+    """
+    return engine
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """FastAPI dependency that yields a database session per request.
 
     Commits on success and rolls back on exception, then closes the session.
+    Declare it with ``Depends(get_db, scope="function")`` so the commit runs
+    before the response is sent.
     """
     async with AsyncSessionLocal() as session:
         try:
@@ -32,3 +141,12 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
+
+
+async def get_db_readonly() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency that yields an autocommit session for read-only routes.
+
+    Nothing is committed or rolled back; the session is simply closed.
+    """
+    async with ReadOnlySessionLocal() as session:
+        yield session
@@ -1,34 +1,101 @@
 """FastAPI application entry point and route definitions."""
 
-from collections.abc import AsyncGenerator
+import logging
+from collections import OrderedDict, deque
+from collections.abc import AsyncGenerator, Sequence
 from contextlib import asynccontextmanager
+from time import monotonic
 from typing import Any
-
-from fastapi import Depends, FastAPI, HTTPException, Path, Query, Request, status
-from fastapi.responses import JSONResponse
+from uuid import uuid4
+
+import msgspec
+from fastapi import (
+    Body,
+    Depends,
+    FastAPI,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    status,
+)
+from fastapi.responses import JSONResponse, Response
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from . import crud
-from .config import settings
-from .database import Base, engine, get_db
-from .schemas import TaskCreate, TaskResponse, TaskUpdate
+from .config import get_settings
+from .database import (
+    Base,
+    engine,
+    get_db,
+    get_db_readonly,
+    get_engine,
+    warm_up_pool,
+)
+from .schemas import TaskCreate, TaskResponse, TaskResponseStruct, TaskUpdate
+
+try:
+    from redis.asyncio import Redis
+    from redis.exceptions import RedisError
+except ImportError:  # redis is an optional extra
+    Redis = None  # type: ignore[assignment,misc]
+
+    class RedisError(Exception):  # type: ignore[no-redef]
+        """Stand-in so the Redis fallback path works without redis installed."""
+
+
+logger = logging.getLogger(__name__)
+
+_encode_json = msgspec.json.Encoder().encode
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Create database tables on startup and dispose the engine on shutdown.
 
+    Startup also pre-opens the connection pool and, when REDIS_URL is
+    configured, registers the shared rate-limit script so requests only send
+    its SHA.
+
     In production, prefer Alembic migrations over auto-creation.
     """
+    settings = get_settings()
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    await warm_up_pool(engine, settings.database_pool_size)
+
+    redis_url = settings.redis_url
+    redis_client = None
+    if redis_url:
+        if Redis is None:
+            raise RuntimeError(
+                "REDIS_URL is set but redis is not installed; "
+                'install the "redis" extra.'
+            )
+        redis_client = Redis.from_url(
+            redis_url,
+            socket_timeout=_REDIS_TIMEOUT_SECONDS,
+            socket_connect_timeout=_REDIS_TIMEOUT_SECONDS,
+        )
+        app.state.rate_limit_script = redis_client.register_script(_SLIDING_WINDOW_LUA)
+        try:
+            await redis_client.script_load(_SLIDING_WINDOW_LUA)
+        except RedisError:
+            logger.warning(
+                "Could not preload rate-limit script; Redis may be unavailable",
+                exc_info=True,
+            )
+
     yield
+
+    if redis_client is not None:
+        await redis_client.aclose()
     await engine.dispose()
 
 
 app = FastAPI(
-    title=settings.app_name,
+    title=get_settings().app_name,
     description="A task management REST API built with FastAPI and async SQLAlchemy.",
     version="0.1.0",
     lifespan=lifespan,
@@ -45,38 +112,118 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
 
 
 # ---------------------------------------------------------------------------
-# Simple in-memory rate limiting
+# Rate limiting
 # ---------------------------------------------------------------------------
 
-_RATE_LIMIT_BUCKETS: dict[tuple[str, str], list[float]] = {}
+_RATE_LIMIT_WINDOW_SECONDS = 60.0
+_RATE_LIMIT_MAX_REQUESTS = 60
+_RATE_LIMIT_MAX_KEYS = 100_000
+
+_RATE_LIMIT_BUCKETS: OrderedDict[tuple[str, str], deque[float]] = OrderedDict()
+
+# Redis sits on every request's path, so an unreachable server must fail fast
+# into the per-process fallback rather than stall until the OS gives up.
+_REDIS_TIMEOUT_SECONDS = 0.05
+# After a Redis error, skip Redis entirely for this long before trying again.
+_REDIS_RETRY_SECONDS = 5.0
+_redis_retry_at = float("-inf")  # monotonic time; finite while Redis is down
+
+# Sliding window over a sorted set scored by Redis server time (microseconds),
+# so every worker shares one window and one clock. Returns 1 if allowed.
+_SLIDING_WINDOW_LUA = """
+local key = KEYS[1]
+local window_us = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000000 + tonumber(t[2])
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window_us)
+if redis.call('ZCARD', key) >= limit then
+    return 0
+end
+redis.call('ZADD', key, now, ARGV[3])
+redis.call('PEXPIRE', key, math.ceil(window_us / 1000))
+return 1
+"""
+
+
+def _rate_limit_exceeded() -> HTTPException:
+    """Build the 429 error raised when a client exceeds its limit."""
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Rate limit exceeded. Please try again later.",
+    )
 
 
 async def rate_limiter(request: Request) -> None:
-    """Naive per-process rate limiter keyed by client IP and path.
+    """Rate limiter keyed by client IP and path.
 
-    Allows up to 60 requests per minute per IP per path.
-    """
-    import time
+    Allows up to 60 requests per minute per IP per path. When a Redis script
+    was registered at startup the window is shared by all workers; otherwise,
+    or if Redis errors, the per-process limiter is used.
 
-    window_seconds = 60.0
-    max_requests = 60
+    A Redis error also opens a simple circuit breaker: Redis is not tried
+    again for _REDIS_RETRY_SECONDS, and only entering and leaving that
+    degraded state is logged.
+    """
+    global _redis_retry_at
 
     client_ip = request.client.host if request.client else "unknown"
-    key = (client_ip, request.url.path)
-    now = time.time()
+    path = request.url.path
+
+    script = getattr(request.app.state, "rate_limit_script", None)
+    if script is not None and monotonic() >= _redis_retry_at:
+        try:
+            allowed = await script(
+                keys=[f"rate_limit:{client_ip}:{path}"],
+                args=[
+                    int(_RATE_LIMIT_WINDOW_SECONDS * 1_000_000),
+                    _RATE_LIMIT_MAX_REQUESTS,
+                    uuid4().hex,
+                ],
+            )
+        except RedisError:
+            if _redis_retry_at == float("-inf"):
+                logger.warning(
+                    "Redis rate limiting failed; using per-process limits",
+                    exc_info=True,
+                )
+            _redis_retry_at = monotonic() + _REDIS_RETRY_SECONDS
+        else:
+            if _redis_retry_at != float("-inf"):
+                logger.info("Redis rate limiting recovered")
+                _redis_retry_at = float("-inf")
+            if not allowed:
+                raise _rate_limit_exceeded()
+            return
+
+    _local_rate_limit((client_ip, path))
+
+
+def _local_rate_limit(key: tuple[str, str]) -> None:
+    """Per-process sliding-window limiter used when Redis is not available.
+
+    Each bucket is a deque of monotonic timestamps, so expiring old entries is
+    amortised O(1), and the number of tracked keys is capped by evicting the
+    least recently used.
+    """
+    now = monotonic()
+
+    bucket = _RATE_LIMIT_BUCKETS.get(key)
+    if bucket is None:
+        bucket = _RATE_LIMIT_BUCKETS[key] = deque()
+        if len(_RATE_LIMIT_BUCKETS) > _RATE_LIMIT_MAX_KEYS:
+            _RATE_LIMIT_BUCKETS.popitem(last=False)
+    else:
+        _RATE_LIMIT_BUCKETS.move_to_end(key)
 
-    bucket = _RATE_LIMIT_BUCKETS.get(key, [])
     # Drop entries outside the window
-    bucket = [ts for ts in bucket if now - ts < window_seconds]
+    while bucket and now - bucket[0] >= _RATE_LIMIT_WINDOW_SECONDS:
+        bucket.popleft()
 
-    if len(bucket) >= max_requests:
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail="Rate limit exceeded. Please try again later.",
-        )
+    if len(bucket) >= _RATE_LIMIT_MAX_REQUESTS:
+        raise _rate_limit_exceeded()
 
     bucket.append(now)
-    _RATE_LIMIT_BUCKETS[key] = bucket
 
 
 # ---------------------------------------------------------------------------
@@ -84,27 +231,41 @@ async def rate_limiter(request: Request) -> None:
 # ---------------------------------------------------------------------------
 
 
+_DB_PROBE_TTL_SECONDS = 2.0
+_PING_SQL = text("SELECT 1")
+_db_ok_at = float("-inf")
+
+
 @app.get("/health", tags=["health"], dependencies=[Depends(rate_limiter)])
-async def health_check(db: AsyncSession = Depends(get_db)) -> dict[str, str]:
+async def health_check(
+    db_engine: AsyncEngine = Depends(get_engine),
+) -> dict[str, str]:
     """Return application status and database connectivity check.
-    
+
+    A successful database probe is reused for a couple of seconds, so frequent
+    liveness/readiness polling does not take a pooled connection every time.
+
     Returns:
         Dictionary with status and database connectivity information.
     """
-    health_status: dict[str, str] = {"status": "healthy", "database": "connected"}
+    global _db_ok_at
+
+    now = monotonic()
+    if now - _db_ok_at < _DB_PROBE_TTL_SECONDS:
+        return {"status": "healthy", "database": "connected"}
 
     try:
         # Test database connectivity with a simple query
-        await db.execute(text("SELECT 1"))
+        async with db_engine.connect() as conn:
+            await conn.execute(_PING_SQL)
     except Exception:
-        health_status["status"] = "unhealthy"
-        health_status["database"] = "disconnected"
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Service unavailable",
         )
-    
-    return health_status
+
+    _db_ok_at = now
+    return {"status": "healthy", "database": "connected"}
 
 
 # ---------------------------------------------------------------------------
@@ -121,12 +282,31 @@ async def health_check(db: AsyncSession = Depends(get_db)) -> dict[str, str]:
 )
 async def create_task(
     task: TaskCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> TaskResponse:
     """Create a new task."""
     return await crud.create_task(db, task)
 
 
+@app.post(
+    "/tasks/bulk",
+    response_model=list[TaskResponse],
+    status_code=status.HTTP_201_CREATED,
+    tags=["tasks"],
+    dependencies=[Depends(rate_limiter)],
+)
+async def create_tasks(
+    tasks: list[TaskCreate] = Body(..., min_length=1, max_length=100),
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> list[TaskResponse]:
+    """Create up to 100 tasks in one request and one transaction.
+
+    The whole batch is rejected with 422 if any item fails validation, and the
+    created tasks are returned in request order.
+    """
+    return await crud.create_tasks(db, tasks)
+
+
 @app.get(
     "/tasks",
     response_model=list[TaskResponse],
@@ -142,20 +322,39 @@ async def list_tasks(
         description="Maximum number of records to return",
     ),
     completed: bool | None = Query(None, description="Filter by completion status"),
-    db: AsyncSession = Depends(get_db),
-) -> list[TaskResponse]:
+    after_id: int | None = Query(
+        None,
+        ge=0,
+        description="Return tasks with an ID greater than this cursor; overrides skip",
+    ),
+    db: AsyncSession = Depends(get_db_readonly, scope="function"),
+) -> Response:
     """Return a paginated list of tasks with optional status filter.
-    
+
+    Rows come straight from the database, so they are encoded with msgspec
+    instead of being re-validated through TaskResponse; response_model still
+    documents the shape.
+
     Args:
         skip: Number of records to skip (offset).
         limit: Maximum number of records to return (1-1000).
         completed: Optional filter by completion status. None returns all tasks.
+        after_id: Optional keyset cursor, usually the last ID of the previous
+            page. When given, skip is ignored.
         db: Database session dependency.
-    
+
     Returns:
-        List of TaskResponse objects matching the criteria.
+        JSON list of tasks matching the criteria.
     """
-    return await crud.get_tasks(db, skip=skip, limit=limit, completed=completed)
+    # The list queries select TaskResponseStruct's fields in order, so each
+    # row unpacks positionally into it.
+    rows: Sequence[Sequence[Any]] = await crud.get_tasks(
+        db, skip=skip, limit=limit, completed=completed, after_id=after_id
+    )
+    return Response(
+        content=_encode_json([TaskResponseStruct(*row) for row in rows]),
+        media_type="application/json",
+    )
 
 
 @app.get(
@@ -166,7 +365,7 @@ async def list_tasks(
 )
 async def get_task(
     task_id: int = Path(..., ge=0),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db_readonly, scope="function"),
 ) -> TaskResponse:
     """Return a single task by ID."""
     task = await crud.get_task(db, task_id)
@@ -186,7 +385,7 @@ async def get_task(
 async def update_task(
     task_id: int = Path(..., ge=0),
     task_update: TaskUpdate = ...,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> TaskResponse:
     """Partially update an existing task."""
     task = await crud.update_task(db, task_id, task_update)
@@ -205,7 +404,7 @@ async def update_task(
 )
 async def delete_task(
     task_id: int = Path(..., ge=0),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ) -> None:
     """Delete a task by ID.
     
@@ -216,8 +415,8 @@ async def delete_task(
     Raises:
         HTTPException: 404 if the task is not found.
     """
-    deleted_task = await crud.delete_task(db, task_id)
-    if deleted_task is None:
+    deleted_id = await crud.delete_task(db, task_id)
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Task not found"
         )
@@ -1,22 +1,43 @@
 """SQLAlchemy ORM models."""
 
-from datetime import datetime
-from enum import Enum as PyEnum
+import os
+import time
 import uuid
+from datetime import datetime
+from enum import StrEnum
 
-from sqlalchemy import Boolean, DateTime, Enum, String, func
+from sqlalchemy import Boolean, DateTime, Enum, Index, String, func
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .database import Base
 
 
+def _uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUID (version 7, RFC 9562).
+
+    The leading 48 bits are the Unix time in milliseconds, so new keys land at
+    the right edge of the primary key index instead of at random pages.
+    """
+    unix_ts_ms = time.time_ns() // 1_000_000
+    value = (unix_ts_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 9562 variant
+    return uuid.UUID(int=value)
+
+
+uuid7 = getattr(uuid, "uuid7", _uuid7)
+
+
 class Task(Base):
     """Represents a task in the database."""
 
     __tablename__ = "tasks"
+    __table_args__ = (Index("ix_tasks_completed_id", "completed", "id"),)
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(primary_key=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(String(1000), nullable=True)
     completed: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
@@ -28,12 +49,12 @@ class Task(Base):
     )
 
 
-class TaskStatus(PyEnum):
+class TaskStatus(StrEnum):
     """Enumeration for the status of a task."""
     TODO = "todo"
     IN_PROGRESS = "in_progress"
     DONE = "done"
-class TaskPriority(PyEnum):
+class TaskPriority(StrEnum):
     """Enumeration for the priority of a task."""
     LOW = "low"
     MEDIUM = "medium"
@@ -44,9 +65,7 @@ class TaskV2(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         PG_UUID(as_uuid=True),
         primary_key=True,
-        index=True,
-        default=uuid.uuid4,
-        unique=True,
+        default=uuid7,
         nullable=False,
         doc="Primary UUID key for the task",
     )
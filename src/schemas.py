@@ -1,32 +1,62 @@
 """Pydantic schemas for request validation and response serialization."""
 
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Annotated, ClassVar, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, StrictBool, field_validator, model_validator
+import msgspec
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    StrictBool,
+    StringConstraints,
+    field_validator,
+    model_validator,
+)
+
+from .models import TaskPriority, TaskStatus
+
+_UTC = timezone.utc
+
+# Request bodies: build validators at class creation, reject unknown fields
+# rather than collecting them, and keep validated input immutable.
+_REQUEST_CONFIG = ConfigDict(defer_build=False, extra="forbid", frozen=True)
+
+# Titles are stripped before the length check, so blank strings are rejected.
+_Title = Annotated[
+    str, StringConstraints(strip_whitespace=True, min_length=1, max_length=255)
+]
+_TitleV2 = Annotated[
+    str, StringConstraints(strip_whitespace=True, min_length=1, max_length=200)
+]
+
+
+def _check_future(v: Optional[datetime]) -> Optional[datetime]:
+    """Reject due dates in the past; naive datetimes are treated as UTC."""
+    if v is not None:
+        v_local = v if v.tzinfo is not None else v.replace(tzinfo=_UTC)
+        if v_local < datetime.now(_UTC):
+            raise ValueError("due_date must not be in the past.")
+    return v
 
 
 class TaskBase(BaseModel):
     """Shared fields for task creation and updates."""
 
-    title: str = Field(..., min_length=1, max_length=255, examples=["Buy groceries"])
+    title: _Title = Field(..., examples=["Buy groceries"])
     description: str | None = Field(
         None, max_length=1000, examples=["Milk, eggs, bread"]
     )
 
-    @field_validator("title", mode="before")
-    @classmethod
-    def strip_title(cls, v: str) -> str:
-        """Strip surrounding whitespace; min_length=1 then rejects blank strings."""
-        if isinstance(v, str):
-            return v.strip()
-        return v
-
 
 class TaskCreate(TaskBase):
     """Schema for creating a new task."""
 
+    model_config = _REQUEST_CONFIG
+
+    write_fields: ClassVar[frozenset[str]] = frozenset({"title", "description"})
+
 
 class TaskUpdate(BaseModel):
     """Schema for partially updating an existing task.
@@ -34,17 +64,15 @@ class TaskUpdate(BaseModel):
     All fields are optional; only provided fields are applied.
     """
 
-    title: str | None = Field(None, min_length=1, max_length=255)
+    title: _Title | None = None
     description: str | None = Field(None, max_length=1000)
     completed: StrictBool | None = None
 
-    @field_validator("title", mode="before")
-    @classmethod
-    def strip_title(cls, v: str | None) -> str | None:
-        """Strip surrounding whitespace; min_length=1 then rejects blank strings."""
-        if isinstance(v, str):
-            return v.strip()
-        return v
+    model_config = _REQUEST_CONFIG
+
+    write_fields: ClassVar[frozenset[str]] = frozenset(
+        {"title", "description", "completed"}
+    )
 
 
 class TaskResponse(TaskBase):
@@ -58,23 +86,42 @@ class TaskResponse(TaskBase):
     model_config = {"from_attributes": True}
 
 
-class TaskV2Base(BaseModel):
+class TaskResponseStruct(msgspec.Struct):
+    """Encode-only mirror of TaskResponse for list responses.
+
+    crud's list queries select these fields by name in declaration order, so a
+    row can be unpacked positionally, skipping validation of trusted rows.
+    """
+
+    id: int
+    title: str
+    description: str | None
+    completed: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+class _DueDateMixin:
+    """Due-date check shared by the TaskV2 request schemas."""
+
+    @field_validator("due_date")
+    @classmethod
+    def validate_due_date(cls, v: Optional[datetime]) -> Optional[datetime]:
+        return _check_future(v)
+
+
+class TaskV2Base(_DueDateMixin, BaseModel):
     """
     Shared fields for TaskV2 creation and update.
     """
-    title: str = Field(
-        ...,
-        min_length=1,
-        max_length=200,
-        examples=["Buy groceries"],
-    )
+    title: _TitleV2 = Field(..., examples=["Buy groceries"])
     description: Optional[str] = Field(
         None,
         max_length=10000,
         examples=["Milk, eggs, bread"],
     )
-    status: str = Field(..., pattern="^(todo|in_progress|done)$", examples=["todo"])
-    priority: str = Field(..., pattern="^(low|medium|high)$", examples=["medium"])
+    status: TaskStatus = Field(..., examples=["todo"])
+    priority: TaskPriority = Field(..., examples=["medium"])
     due_date: Optional[datetime] = Field(
         None,
         description=(
@@ -83,61 +130,25 @@ class TaskV2Base(BaseModel):
         ),
     )
 
-    @field_validator("title")
-    @classmethod
-    def strip_title(cls, v: str) -> str:
-        return v.strip()
-
-    @field_validator("due_date")
-    @classmethod
-    def validate_due_date(cls, v: Optional[datetime]) -> Optional[datetime]:
-        if v is not None:
-            now = datetime.now(timezone.utc)
-            # If naive datetime, assume UTC
-            if v.tzinfo is None:
-                v_local = v.replace(tzinfo=timezone.utc)
-            else:
-                v_local = v
-            if v_local < now:
-                raise ValueError("due_date must not be in the past.")
-        return v
-
 class TaskV2Create(TaskV2Base):
     """
     Schema for creating a new TaskV2.
     """
 
-class TaskV2Update(BaseModel):
+    model_config = _REQUEST_CONFIG
+
+class TaskV2Update(_DueDateMixin, BaseModel):
     """
     Schema for partially updating an existing TaskV2.
     All fields are optional; only provided fields are applied.
     """
-    title: Optional[str] = Field(None, min_length=1, max_length=200)
+    title: Optional[_TitleV2] = None
     description: Optional[str] = Field(None, max_length=10000)
-    status: Optional[str] = Field(None, pattern="^(todo|in_progress|done)$")
-    priority: Optional[str] = Field(None, pattern="^(low|medium|high)$")
+    status: Optional[TaskStatus] = None
+    priority: Optional[TaskPriority] = None
     due_date: Optional[datetime] = None
 
-    @field_validator("title")
-    @classmethod
-    def strip_title(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None:
-            return v.strip()
-        return v
-
-    @field_validator("due_date")
-    @classmethod
-    def validate_due_date(cls, v: Optional[datetime]) -> Optional[datetime]:
-        if v is not None:
-            now = datetime.now(timezone.utc)
-            # If naive datetime, assume UTC
-            if v.tzinfo is None:
-                v_local = v.replace(tzinfo=timezone.utc)
-            else:
-                v_local = v
-            if v_local < now:
-                raise ValueError("due_date must not be in the past.")
-        return v
+    model_config = _REQUEST_CONFIG
 
 class TaskV2Response(TaskV2Base):
     """
@@ -1,16 +1,35 @@
 """Shared pytest fixtures for the test suite."""
 
+import os
+
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
 
-from src.database import Base, get_db
+from src import crud
+from src.database import Base, get_db, get_db_readonly, get_engine
 from src.main import app, rate_limiter
+from src.schemas import TaskCreate, TaskResponse
+
+# One named in-memory database per pytest-xdist worker ("master" when serial).
+_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "master")
+TEST_DATABASE_URL = (
+    f"sqlite+aiosqlite:///file:memdb_{_WORKER}?mode=memory&cache=shared&uri=true"
+)
+
+# StaticPool hands every checkout the same connection, so the in-memory
+# database lives exactly as long as the engine.
+test_engine = create_async_engine(TEST_DATABASE_URL, poolclass=StaticPool)
 
-TEST_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
 
-test_engine = create_async_engine(TEST_DATABASE_URL, echo=False)
-TestingSessionLocal = async_sessionmaker(test_engine, expire_on_commit=False)
+async def seed_tasks(client: AsyncClient, n: int) -> list[dict]:
+    """Create n tasks titled "Task 1".."Task n" in one bulk request."""
+    response = await client.post(
+        "/tasks/bulk", json=[{"title": f"Task {i + 1}"} for i in range(n)]
+    )
+    assert response.status_code == 201
+    return response.json()
 
 
 @pytest_asyncio.fixture(scope="session", autouse=True)
@@ -25,24 +44,61 @@ async def create_test_tables():
 
 
 @pytest_asyncio.fixture
-async def db_session() -> AsyncSession:
-    """Yield a database session that is rolled back after each test."""
-    async with TestingSessionLocal() as session:
+async def connection() -> AsyncConnection:
+    """Yield a connection inside an outer transaction rolled back after the test."""
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        yield conn
+        await trans.rollback()
+
+
+@pytest_asyncio.fixture
+async def db_session(connection: AsyncConnection) -> AsyncSession:
+    """Yield a session joined to the test's outer transaction.
+
+    The session works inside a SAVEPOINT, so commits and rollbacks made by the
+    code under test never end the outer transaction and nothing outlives it.
+    """
+    async with AsyncSession(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    ) as session:
         yield session
-        await session.rollback()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def http_client() -> AsyncClient:
+    """Yield one AsyncClient bound to the app for the whole test session."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        yield ac
 
 
 @pytest_asyncio.fixture
-async def client(db_session: AsyncSession) -> AsyncClient:
-    """Yield an AsyncClient wired to the test database session."""
+async def client(http_client: AsyncClient, db_session: AsyncSession) -> AsyncClient:
+    """Yield the shared client with dependencies overridden for this test."""
 
     async def override_get_db():
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_readonly] = override_get_db
+    app.dependency_overrides[get_engine] = lambda: test_engine
     app.dependency_overrides[rate_limiter] = lambda: None
-    async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://test"
-    ) as ac:
-        yield ac
+    yield http_client
     app.dependency_overrides.clear()
+
+
+@pytest_asyncio.fixture
+async def created_task(db_session: AsyncSession) -> dict:
+    """Insert one task through the test session and return it as JSON.
+
+    The row is written directly rather than via POST /tasks, and the app sees
+    it because its session dependencies are overridden with the same session.
+    """
+    task = await crud.create_task(
+        db_session, TaskCreate(title="Original", description="Original desc")
+    )
+    return TaskResponse.model_validate(task).model_dump(mode="json")
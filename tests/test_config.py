@@ -0,0 +1,11 @@
+"""Unit tests for settings loading."""
+
+from src.config import Settings, get_settings
+
+
+def test_get_settings_is_cached() -> None:
+    """get_settings builds Settings once and returns the same instance."""
+    first = get_settings()
+
+    assert isinstance(first, Settings)
+    assert get_settings() is first
@@ -3,14 +3,27 @@
 The HTTP integration tests exercise CRUD through FastAPI's transport layer,
 which doesn't attribute coverage back to the crud module's return statements
 and branch paths. These tests call each function directly via a db_session
-fixture to cover lines 16, 38, 47, 59-63, 67, and 81-84.
+fixture to cover the found / not-found results, the completed filter and
+keyset branches of get_tasks, single and bulk inserts, partial and empty
+updates, and deletes.
 """
 
+from typing import Any
+
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src import crud
-from src.schemas import TaskCreate, TaskUpdate
+from src.models import Task
+from src.schemas import TaskCreate, TaskResponseStruct, TaskUpdate
+
+
+async def _bulk_create(session: AsyncSession, *specs: dict[str, Any]) -> list[Task]:
+    """Insert one Task per spec with a single flush and return them in order."""
+    tasks = [Task(**spec) for spec in specs]
+    session.add_all(tasks)
+    await session.flush()
+    return tasks
 
 
 # ---------------------------------------------------------------------------
@@ -25,7 +38,7 @@ async def test_get_task_returns_none_when_not_found(db_session: AsyncSession) ->
 
 
 async def test_get_task_returns_task_when_found(db_session: AsyncSession) -> None:
-    """get_task returns the correct Task instance by primary key."""
+    """get_task returns the correct task row by primary key."""
     created = await crud.create_task(db_session, TaskCreate(title="Find me"))
 
     result = await crud.get_task(db_session, created.id)
@@ -42,8 +55,7 @@ async def test_get_task_returns_task_when_found(db_session: AsyncSession) -> Non
 
 async def test_get_tasks_returns_list(db_session: AsyncSession) -> None:
     """get_tasks returns all tasks as a list."""
-    await crud.create_task(db_session, TaskCreate(title="Alpha"))
-    await crud.create_task(db_session, TaskCreate(title="Beta"))
+    await _bulk_create(db_session, {"title": "Alpha"}, {"title": "Beta"})
 
     result = await crud.get_tasks(db_session)
 
@@ -53,9 +65,9 @@ async def test_get_tasks_returns_list(db_session: AsyncSession) -> None:
 
 async def test_get_tasks_filter_completed_true(db_session: AsyncSession) -> None:
     """get_tasks(completed=True) returns only completed tasks."""
-    task = await crud.create_task(db_session, TaskCreate(title="Done"))
-    await crud.update_task(db_session, task.id, TaskUpdate(completed=True))
-    await crud.create_task(db_session, TaskCreate(title="Pending"))
+    await _bulk_create(
+        db_session, {"title": "Done", "completed": True}, {"title": "Pending"}
+    )
 
     result = await crud.get_tasks(db_session, completed=True)
 
@@ -65,9 +77,9 @@ async def test_get_tasks_filter_completed_true(db_session: AsyncSession) -> None
 
 async def test_get_tasks_filter_completed_false(db_session: AsyncSession) -> None:
     """get_tasks(completed=False) returns only incomplete tasks."""
-    task = await crud.create_task(db_session, TaskCreate(title="Done"))
-    await crud.update_task(db_session, task.id, TaskUpdate(completed=True))
-    await crud.create_task(db_session, TaskCreate(title="Pending"))
+    await _bulk_create(
+        db_session, {"title": "Done", "completed": True}, {"title": "Pending"}
+    )
 
     result = await crud.get_tasks(db_session, completed=False)
 
@@ -75,6 +87,28 @@ async def test_get_tasks_filter_completed_false(db_session: AsyncSession) -> Non
     assert result[0].completed is False
 
 
+async def test_get_tasks_rows_match_response_struct_fields(
+    db_session: AsyncSession,
+) -> None:
+    """get_tasks rows carry TaskResponseStruct's fields in its order."""
+    await _bulk_create(db_session, {"title": "Alpha"})
+
+    (row,) = await crud.get_tasks(db_session)
+
+    assert row._fields == TaskResponseStruct.__struct_fields__
+
+
+async def test_get_tasks_keyset_pagination(db_session: AsyncSession) -> None:
+    """get_tasks(after_id=...) returns the next page ordered by ID."""
+    created = await _bulk_create(
+        db_session, *({"title": f"Task {i}"} for i in range(5))
+    )
+
+    page = await crud.get_tasks(db_session, limit=2, after_id=created[1].id)
+
+    assert [task.id for task in page] == [created[2].id, created[3].id]
+
+
 # ---------------------------------------------------------------------------
 # create_task
 # ---------------------------------------------------------------------------
@@ -94,6 +128,19 @@ async def test_create_task_returns_persisted_task(db_session: AsyncSession) -> N
     assert task.updated_at is not None
 
 
+async def test_create_tasks_returns_tasks_in_input_order(
+    db_session: AsyncSession,
+) -> None:
+    """create_tasks inserts every task and returns them in input order."""
+    tasks = await crud.create_tasks(
+        db_session, [TaskCreate(title=f"Task {i}") for i in range(3)]
+    )
+
+    assert [task.title for task in tasks] == ["Task 0", "Task 1", "Task 2"]
+    assert [task.id for task in tasks] == sorted(task.id for task in tasks)
+    assert all(task.created_at is not None for task in tasks)
+
+
 # ---------------------------------------------------------------------------
 # update_task
 # ---------------------------------------------------------------------------
@@ -148,15 +195,14 @@ async def test_delete_task_returns_none_when_not_found(
     assert result is None
 
 
-async def test_delete_task_returns_deleted_instance(db_session: AsyncSession) -> None:
-    """delete_task returns the deleted Task and removes it from the DB."""
+async def test_delete_task_returns_deleted_id(db_session: AsyncSession) -> None:
+    """delete_task returns the deleted task's ID and removes it from the DB."""
     task = await crud.create_task(db_session, TaskCreate(title="Goodbye"))
     task_id = task.id
 
     deleted = await crud.delete_task(db_session, task_id)
 
-    assert deleted is not None
-    assert deleted.id == task_id
+    assert deleted == task_id
 
     # Verify the record is no longer retrievable
     gone = await crud.get_task(db_session, task_id)
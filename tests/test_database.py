@@ -1,15 +1,32 @@
-"""Unit tests for the get_db dependency.
+"""Unit tests for the database module.
 
-All HTTP tests override get_db entirely via dependency_overrides, so the
-function body (commit / rollback logic) is never reached from that path.
-These tests drive the async generator directly with a mocked session to
-cover lines 28-34.
+All HTTP tests override the session dependencies via dependency_overrides, so
+get_db's commit / rollback logic is never reached from that path. These tests
+drive the dependency generators directly with mocked sessions, and check the
+engine options and pool warm-up against known settings and mocked engines.
 """
 
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
-from unittest.mock import AsyncMock, patch
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, StaticPool
+
+from src.config import Settings
+from src.database import (
+    _engine_options,
+    get_db,
+    get_db_readonly,
+    warm_up_pool,
+)
+
 
-from src.database import get_db
+@pytest.fixture(autouse=True)
+def default_settings() -> Iterator[Settings]:
+    """Give _engine_options the field defaults, ignoring .env and the environment."""
+    settings = Settings.model_construct()
+    with patch("src.database.get_settings", return_value=settings):
+        yield settings
 
 
 async def test_get_db_yields_session() -> None:
@@ -64,3 +81,131 @@ async def test_get_db_rolls_back_on_exception() -> None:
 
     mock_session.rollback.assert_awaited_once()
     mock_session.commit.assert_not_awaited()
+
+
+async def test_get_db_readonly_yields_session_without_committing() -> None:
+    """get_db_readonly yields a ReadOnlySessionLocal session and never commits."""
+    mock_session = AsyncMock()
+    mock_cm = AsyncMock()
+    mock_cm.__aenter__.return_value = mock_session
+    mock_cm.__aexit__.return_value = False
+
+    with patch("src.database.ReadOnlySessionLocal", return_value=mock_cm):
+        gen = get_db_readonly()
+        session = await gen.__anext__()
+        with pytest.raises(StopAsyncIteration):
+            await gen.asend(None)
+
+    assert session is mock_session
+    mock_session.commit.assert_not_awaited()
+    mock_cm.__aexit__.assert_awaited_once()
+
+
+def test_engine_options_sqlite_file_has_no_pool_sizing() -> None:
+    """File-backed SQLite keeps the dialect's default pool without sizing."""
+    options = _engine_options("sqlite+aiosqlite:///./tasks.db")
+
+    assert options["connect_args"] == {"check_same_thread": False}
+    assert "poolclass" not in options
+    assert "pool_size" not in options
+
+
+def test_engine_options_sqlite_memory_uses_static_pool() -> None:
+    """In-memory SQLite shares one connection through StaticPool."""
+    options = _engine_options("sqlite+aiosqlite:///:memory:")
+
+    assert options["poolclass"] is StaticPool
+    assert "pool_size" not in options
+    assert "pool_use_lifo" not in options
+
+
+def test_engine_options_server_backend_applies_pool_settings() -> None:
+    """Server backends get the pool sizing configured in settings."""
+    options = _engine_options("postgresql+asyncpg://user:pw@localhost/tasks")
+
+    assert options["pool_size"] == 25
+    assert options["max_overflow"] == 25
+    assert options["pool_timeout"] == 30.0
+    assert options["pool_recycle"] == 1800
+    assert options["pool_pre_ping"] is True
+    assert options["pool_use_lifo"] is True
+    assert "echo" not in options
+
+
+def test_engine_options_asyncpg_uses_async_queue_pool() -> None:
+    """asyncpg URLs get the async-adapted queue pool and driver cache defaults."""
+    options = _engine_options("postgresql+asyncpg://user:pw@localhost/tasks")
+
+    assert options["poolclass"] is AsyncAdaptedQueuePool
+    assert "connect_args" not in options
+
+
+def test_engine_options_asyncpg_behind_pgbouncer() -> None:
+    """With database_pgbouncer set, asyncpg gets NullPool and unique statements."""
+    settings = Settings.model_construct(database_pgbouncer=True)
+    with patch("src.database.get_settings", return_value=settings):
+        options = _engine_options("postgresql+asyncpg://user:pw@pgbouncer/tasks")
+
+    assert options["poolclass"] is NullPool
+    assert "pool_size" not in options
+    connect_args = options["connect_args"]
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    name_func = connect_args["prepared_statement_name_func"]
+    assert name_func().startswith("__asyncpg_")
+    assert name_func() != name_func()
+
+
+def test_engine_options_rejects_psycopg2() -> None:
+    """The synchronous psycopg2 driver is rejected up front."""
+    with pytest.raises(ValueError, match="psycopg2"):
+        _engine_options("postgresql+psycopg2://user:pw@localhost/tasks")
+
+
+async def test_warm_up_pool_opens_and_releases_connections() -> None:
+    """warm_up_pool opens size connections and closes each back to the pool."""
+    connection = AsyncMock()
+    db_engine = MagicMock()
+    db_engine.dialect.name = "postgresql"
+    db_engine.connect = AsyncMock(return_value=connection)
+
+    await warm_up_pool(db_engine, 3)
+
+    assert db_engine.connect.await_count == 3
+    assert connection.close.await_count == 3
+
+
+async def test_warm_up_pool_closes_opened_connections_when_one_fails() -> None:
+    """A failed connect still releases the others and then re-raises."""
+    connection = AsyncMock()
+    db_engine = MagicMock()
+    db_engine.dialect.name = "postgresql"
+    db_engine.connect = AsyncMock(
+        side_effect=[connection, OSError("connection refused"), connection]
+    )
+
+    with pytest.raises(OSError, match="connection refused"):
+        await warm_up_pool(db_engine, 3)
+
+    assert connection.close.await_count == 2
+
+
+async def test_warm_up_pool_skips_null_pool() -> None:
+    """warm_up_pool does nothing when the engine keeps no pooled connections."""
+    db_engine = MagicMock()
+    db_engine.dialect.name = "postgresql"
+    db_engine.pool = NullPool(creator=MagicMock())
+
+    await warm_up_pool(db_engine, 3)
+
+    db_engine.connect.assert_not_called()
+
+
+async def test_warm_up_pool_skips_sqlite() -> None:
+    """warm_up_pool does nothing for SQLite engines."""
+    db_engine = MagicMock()
+    db_engine.dialect.name = "sqlite"
+
+    await warm_up_pool(db_engine, 3)
+
+    db_engine.connect.assert_not_called()
@@ -0,0 +1,20 @@
+"""Unit tests for model-level helpers."""
+
+import uuid
+
+from src.models import _uuid7
+
+
+def test_uuid7_sets_version_and_variant() -> None:
+    """_uuid7 produces RFC 9562 version 7 UUIDs."""
+    value = _uuid7()
+
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_uuid7_prefix_is_time_ordered() -> None:
+    """The millisecond timestamp prefix never decreases between calls."""
+    first, second = _uuid7(), _uuid7()
+
+    assert first.int >> 80 <= second.int >> 80
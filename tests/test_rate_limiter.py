@@ -0,0 +1,180 @@
+"""Unit tests for the rate_limiter dependency.
+
+The HTTP tests override rate_limiter, so its bucket bookkeeping and the Redis
+script path are driven here directly with a minimal stand-in for the incoming
+Request. The lifespan's Redis script registration is covered with a mocked
+client.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src import main
+from src.config import Settings
+from src.main import rate_limiter
+
+
+def _request(
+    host: str = "10.0.0.1", path: str = "/tasks", script: AsyncMock | None = None
+) -> SimpleNamespace:
+    """Build the subset of a Request that rate_limiter reads."""
+    state = SimpleNamespace()
+    if script is not None:
+        state.rate_limit_script = script
+    return SimpleNamespace(
+        client=SimpleNamespace(host=host),
+        url=SimpleNamespace(path=path),
+        app=SimpleNamespace(state=state),
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_buckets(monkeypatch: pytest.MonkeyPatch):
+    """Start and finish every test with no tracked clients and Redis healthy."""
+    monkeypatch.setattr(main, "_redis_retry_at", float("-inf"))
+    main._RATE_LIMIT_BUCKETS.clear()
+    yield
+    main._RATE_LIMIT_BUCKETS.clear()
+
+
+async def test_rate_limiter_rejects_requests_over_the_limit() -> None:
+    """The request after the per-window maximum is rejected with 429."""
+    for _ in range(main._RATE_LIMIT_MAX_REQUESTS):
+        await rate_limiter(_request())
+
+    with pytest.raises(HTTPException) as exc_info:
+        await rate_limiter(_request())
+
+    assert exc_info.value.status_code == 429
+
+
+async def test_rate_limiter_expires_entries_outside_window(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Timestamps older than the window no longer count toward the limit."""
+    monkeypatch.setattr(main, "monotonic", lambda: 1000.0)
+    for _ in range(main._RATE_LIMIT_MAX_REQUESTS):
+        await rate_limiter(_request())
+
+    later = 1000.0 + main._RATE_LIMIT_WINDOW_SECONDS
+    monkeypatch.setattr(main, "monotonic", lambda: later)
+    await rate_limiter(_request())
+
+    assert len(main._RATE_LIMIT_BUCKETS[("10.0.0.1", "/tasks")]) == 1
+
+
+async def test_rate_limiter_evicts_least_recently_used_key(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Once the key cap is reached the least recently used bucket is dropped."""
+    monkeypatch.setattr(main, "_RATE_LIMIT_MAX_KEYS", 2)
+
+    await rate_limiter(_request(host="a"))
+    await rate_limiter(_request(host="b"))
+    await rate_limiter(_request(host="a"))  # refresh "a"
+    await rate_limiter(_request(host="c"))
+
+    assert list(main._RATE_LIMIT_BUCKETS) == [("a", "/tasks"), ("c", "/tasks")]
+
+
+async def test_rate_limiter_uses_redis_script_when_registered() -> None:
+    """An allowed Redis verdict skips the per-process buckets entirely."""
+    script = AsyncMock(return_value=1)
+
+    await rate_limiter(_request(script=script))
+
+    script.assert_awaited_once()
+    assert script.await_args.kwargs["keys"] == ["rate_limit:10.0.0.1:/tasks"]
+    assert not main._RATE_LIMIT_BUCKETS
+
+
+async def test_rate_limiter_rejects_when_redis_denies() -> None:
+    """A denied Redis verdict is surfaced as 429."""
+    script = AsyncMock(return_value=0)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await rate_limiter(_request(script=script))
+
+    assert exc_info.value.status_code == 429
+
+
+async def test_rate_limiter_falls_back_when_redis_errors() -> None:
+    """A Redis failure falls back to the per-process limiter."""
+    script = AsyncMock(side_effect=main.RedisError("connection refused"))
+
+    await rate_limiter(_request(script=script))
+
+    assert len(main._RATE_LIMIT_BUCKETS[("10.0.0.1", "/tasks")]) == 1
+
+
+async def test_rate_limiter_skips_redis_while_circuit_is_open(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """After a Redis error, Redis is not retried or logged until the retry time."""
+    monkeypatch.setattr(main, "monotonic", lambda: 1000.0)
+    script = AsyncMock(side_effect=main.RedisError("connection refused"))
+
+    with caplog.at_level("WARNING", logger=main.logger.name):
+        await rate_limiter(_request(script=script))
+        await rate_limiter(_request(script=script))
+
+    script.assert_awaited_once()
+    assert len(caplog.records) == 1
+    assert main._redis_retry_at == 1000.0 + main._REDIS_RETRY_SECONDS
+    assert len(main._RATE_LIMIT_BUCKETS[("10.0.0.1", "/tasks")]) == 2
+
+
+async def test_rate_limiter_closes_circuit_when_redis_recovers(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Once the retry time passes, a successful Redis call leaves degraded mode."""
+    monkeypatch.setattr(main, "monotonic", lambda: 1000.0)
+    script = AsyncMock(side_effect=[main.RedisError("connection refused"), 1])
+    await rate_limiter(_request(script=script))
+
+    later = 1000.0 + main._REDIS_RETRY_SECONDS
+    monkeypatch.setattr(main, "monotonic", lambda: later)
+    caplog.clear()
+    with caplog.at_level("INFO", logger=main.logger.name):
+        await rate_limiter(_request(script=script))
+
+    assert script.await_count == 2
+    assert [r.getMessage() for r in caplog.records] == ["Redis rate limiting recovered"]
+    assert main._redis_retry_at == float("-inf")
+    assert len(main._RATE_LIMIT_BUCKETS[("10.0.0.1", "/tasks")]) == 1
+
+
+async def test_lifespan_registers_redis_script_with_short_timeouts(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """With REDIS_URL set, startup registers the script on a fail-fast client."""
+    redis_url = "redis://redis:6379/0"
+    client = MagicMock()
+    client.script_load = AsyncMock()
+    client.aclose = AsyncMock()
+    redis_cls = MagicMock()
+    redis_cls.from_url.return_value = client
+    monkeypatch.setattr(main, "Redis", redis_cls)
+    monkeypatch.setattr(
+        main, "get_settings", lambda: Settings.model_construct(redis_url=redis_url)
+    )
+    monkeypatch.setattr(
+        main, "engine", create_async_engine("sqlite+aiosqlite:///:memory:")
+    )
+    app = SimpleNamespace(state=SimpleNamespace())
+
+    async with main.lifespan(app):
+        assert app.state.rate_limit_script is client.register_script.return_value
+
+    redis_cls.from_url.assert_called_once_with(
+        redis_url,
+        socket_timeout=main._REDIS_TIMEOUT_SECONDS,
+        socket_connect_timeout=main._REDIS_TIMEOUT_SECONDS,
+    )
+    client.register_script.assert_called_once_with(main._SLIDING_WINDOW_LUA)
+    client.script_load.assert_awaited_once_with(main._SLIDING_WINDOW_LUA)
+    client.aclose.assert_awaited_once()
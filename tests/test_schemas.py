@@ -0,0 +1,86 @@
+"""Unit tests for schema validation rules not reachable through the v1 routes."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from pydantic import ValidationError
+
+from src.models import TaskPriority, TaskStatus
+from src.schemas import TaskCreate, TaskUpdate, TaskV2Create, TaskV2Update
+
+
+def _v2_payload(**overrides: object) -> dict[str, object]:
+    """Build a valid TaskV2Create payload with optional overrides."""
+    payload: dict[str, object] = {
+        "title": "Plan sprint",
+        "status": "todo",
+        "priority": "medium",
+    }
+    payload.update(overrides)
+    return payload
+
+
+@pytest.mark.parametrize("model", [TaskV2Create, TaskV2Update])
+def test_v2_title_is_stripped_and_blank_is_rejected(model: type) -> None:
+    """TaskV2 titles are stripped before the min_length check."""
+    assert model(**_v2_payload(title="  Plan  ")).title == "Plan"
+
+    with pytest.raises(ValidationError, match="at least 1 character"):
+        model(**_v2_payload(title="   "))
+
+
+@pytest.mark.parametrize("model", [TaskV2Create, TaskV2Update])
+def test_due_date_in_past_is_rejected(model: type) -> None:
+    """Both TaskV2 schemas reject a due_date in the past."""
+    past = datetime.now(UTC) - timedelta(days=1)
+
+    with pytest.raises(ValidationError, match="due_date must not be in the past"):
+        model(**_v2_payload(due_date=past))
+
+
+@pytest.mark.parametrize("model", [TaskV2Create, TaskV2Update])
+def test_naive_future_due_date_is_accepted(model: type) -> None:
+    """A naive due_date is treated as UTC and accepted when in the future."""
+    future = datetime.now(UTC).replace(tzinfo=None) + timedelta(days=1)
+
+    task = model(**_v2_payload(due_date=future))
+
+    assert task.due_date == future
+
+
+def test_status_and_priority_parse_to_enums() -> None:
+    """status and priority strings are validated into their enum members."""
+    task = TaskV2Create(**_v2_payload(status="in_progress", priority="high"))
+
+    assert task.status is TaskStatus.IN_PROGRESS
+    assert task.priority is TaskPriority.HIGH
+
+
+@pytest.mark.parametrize("field", ["status", "priority"])
+def test_unknown_status_or_priority_is_rejected(field: str) -> None:
+    """Values outside the enum are rejected on create and update."""
+    with pytest.raises(ValidationError):
+        TaskV2Create(**_v2_payload(**{field: "urgent"}))
+    with pytest.raises(ValidationError):
+        TaskV2Update(**{field: "urgent"})
+
+
+@pytest.mark.parametrize(
+    ("model", "payload"),
+    [
+        (TaskCreate, {"title": "Task"}),
+        (TaskUpdate, {}),
+        (TaskV2Create, _v2_payload()),
+        (TaskV2Update, {}),
+    ],
+)
+def test_request_schemas_forbid_extra_fields_and_are_frozen(
+    model: type, payload: dict[str, object]
+) -> None:
+    """Request schemas reject unknown fields and cannot be mutated."""
+    with pytest.raises(ValidationError, match="Extra inputs are not permitted"):
+        model(**payload, owner="someone")
+
+    task = model(**payload)
+    with pytest.raises(ValidationError, match="frozen"):
+        task.title = "Changed"
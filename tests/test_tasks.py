@@ -1,14 +1,28 @@
 """Comprehensive integration tests for the /tasks endpoints."""
 
+from unittest.mock import MagicMock
+
+import pytest
 from httpx import AsyncClient
 
+from src import main
+from src.database import get_engine
+from src.main import app
+from tests.conftest import seed_tasks
+
 
 # ---------------------------------------------------------------------------
 # Health Endpoint
 # ---------------------------------------------------------------------------
 
 
-async def test_health_check_success(client: AsyncClient) -> None:
+@pytest.fixture
+def stale_db_probe(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Force /health to run a fresh database probe."""
+    monkeypatch.setattr(main, "_db_ok_at", float("-inf"))
+
+
+async def test_health_check_success(client: AsyncClient, stale_db_probe: None) -> None:
     """GET /health returns 200 with healthy status and database connected."""
     response = await client.get("/health")
     assert response.status_code == 200
@@ -17,6 +31,33 @@ async def test_health_check_success(client: AsyncClient) -> None:
     assert data["database"] == "connected"
 
 
+async def test_health_check_reuses_recent_probe(
+    client: AsyncClient, stale_db_probe: None
+) -> None:
+    """GET /health skips the database probe while a recent success is cached."""
+    await client.get("/health")
+    failing_engine = MagicMock()
+    app.dependency_overrides[get_engine] = lambda: failing_engine
+
+    response = await client.get("/health")
+
+    assert response.status_code == 200
+    failing_engine.connect.assert_not_called()
+
+
+async def test_health_check_database_down_returns_503(
+    client: AsyncClient, stale_db_probe: None
+) -> None:
+    """GET /health returns 503 when the database probe fails."""
+    failing_engine = MagicMock()
+    failing_engine.connect.side_effect = ConnectionError("database is down")
+    app.dependency_overrides[get_engine] = lambda: failing_engine
+
+    response = await client.get("/health")
+
+    assert response.status_code == 503
+
+
 # ---------------------------------------------------------------------------
 # POST /tasks - Create Task
 # ---------------------------------------------------------------------------
@@ -47,69 +88,34 @@ async def test_create_task_without_description(client: AsyncClient) -> None:
     assert data["completed"] is False
 
 
-async def test_create_task_missing_title_returns_422(client: AsyncClient) -> None:
-    """POST /tasks rejects request with missing title field."""
-    response = await client.post("/tasks", json={"description": "No title"})
-    assert response.status_code == 422
-    error_detail = response.json()["detail"]
-    assert any("title" in str(err).lower() for err in error_detail)
-
-
-async def test_create_task_empty_title_returns_422(client: AsyncClient) -> None:
-    """POST /tasks rejects an empty title string."""
-    response = await client.post("/tasks", json={"title": ""})
-    assert response.status_code == 422
-    error_detail = response.json()["detail"]
-    assert any("title" in str(err).lower() for err in error_detail)
-
-
-async def test_create_task_title_too_long_returns_422(client: AsyncClient) -> None:
-    """POST /tasks rejects title exceeding 255 characters."""
-    long_title = "a" * 256
-    response = await client.post("/tasks", json={"title": long_title})
-    assert response.status_code == 422
-    error_detail = response.json()["detail"]
-    assert any(
-        "title" in str(err).lower() or "length" in str(err).lower()
-        for err in error_detail
-    )
+# ---------------------------------------------------------------------------
+# POST /tasks/bulk - Create Tasks
+# ---------------------------------------------------------------------------
 
 
-async def test_create_task_description_too_long_returns_422(
-    client: AsyncClient,
-) -> None:
-    """POST /tasks rejects description exceeding 1000 characters."""
-    long_description = "a" * 1001
+async def test_create_tasks_bulk_returns_201_in_order(client: AsyncClient) -> None:
+    """POST /tasks/bulk creates every task and returns them in request order."""
     response = await client.post(
-        "/tasks", json={"title": "Valid title", "description": long_description}
-    )
-    assert response.status_code == 422
-    error_detail = response.json()["detail"]
-    assert any(
-        "description" in str(err).lower() or "length" in str(err).lower()
-        for err in error_detail
+        "/tasks/bulk",
+        json=[{"title": "First"}, {"title": "Second", "description": "Details"}],
     )
+    assert response.status_code == 201
+    data = response.json()
+    assert [task["title"] for task in data] == ["First", "Second"]
+    assert data[1]["description"] == "Details"
+    assert data[0]["id"] < data[1]["id"]
+    assert all(task["completed"] is False for task in data)
 
 
-async def test_create_task_title_whitespace_only_returns_422(
+async def test_create_tasks_bulk_invalid_item_creates_nothing(
     client: AsyncClient,
 ) -> None:
-    """POST /tasks rejects title with only whitespace characters."""
-    response = await client.post("/tasks", json={"title": "   \t\n  "})
-    assert response.status_code == 422
-    # After stripping, empty string violates min_length=1
-
-
-async def test_create_task_empty_json_returns_422(client: AsyncClient) -> None:
-    """POST /tasks rejects empty JSON body."""
-    response = await client.post("/tasks", json={})
+    """POST /tasks/bulk rejects the whole batch when one item is invalid."""
+    response = await client.post("/tasks/bulk", json=[{"title": "Ok"}, {"title": ""}])
     assert response.status_code == 422
 
-
-async def test_create_task_invalid_json_returns_422(client: AsyncClient) -> None:
-    """POST /tasks rejects invalid JSON structure."""
-    response = await client.post("/tasks", json={"title": None})
-    assert response.status_code == 422
+    listed = await client.get("/tasks")
+    assert listed.json() == []
 
 
 # ---------------------------------------------------------------------------
@@ -126,10 +132,7 @@ async def test_list_tasks_empty_returns_empty_list(client: AsyncClient) -> None:
 
 async def test_list_tasks_returns_all_tasks(client: AsyncClient) -> None:
     """GET /tasks returns all tasks without pagination."""
-    # Create multiple tasks
-    await client.post("/tasks", json={"title": "Task 1"})
-    await client.post("/tasks", json={"title": "Task 2"})
-    await client.post("/tasks", json={"title": "Task 3"})
+    await seed_tasks(client, 3)
 
     response = await client.get("/tasks")
     assert response.status_code == 200
@@ -138,43 +141,57 @@ async def test_list_tasks_returns_all_tasks(client: AsyncClient) -> None:
     assert all("id" in task and "title" in task for task in data)
 
 
-async def test_list_tasks_pagination_skip(client: AsyncClient) -> None:
-    """GET /tasks respects skip parameter for pagination."""
-    # Create 5 tasks
-    for i in range(5):
-        await client.post("/tasks", json={"title": f"Task {i+1}"})
+async def test_list_tasks_items_match_single_task_response(
+    client: AsyncClient,
+) -> None:
+    """GET /tasks encodes each task exactly as GET /tasks/{id} does."""
+    created = await client.post(
+        "/tasks", json={"title": "Same shape", "description": "Both endpoints"}
+    )
+    task_id = created.json()["id"]
 
-    # Skip first 2
-    response = await client.get("/tasks?skip=2")
-    assert response.status_code == 200
-    data = response.json()
-    assert len(data) == 3
+    listed = await client.get("/tasks")
+    single = await client.get(f"/tasks/{task_id}")
 
+    assert listed.json() == [single.json()]
 
-async def test_list_tasks_pagination_limit(client: AsyncClient) -> None:
-    """GET /tasks respects limit parameter for pagination."""
-    # Create 5 tasks
-    for i in range(5):
-        await client.post("/tasks", json={"title": f"Task {i+1}"})
 
-    # Limit to 2
-    response = await client.get("/tasks?limit=2")
+@pytest.mark.parametrize(
+    ("query", "expected_titles"),
+    [
+        ("skip=2", [f"Task {i}" for i in range(3, 11)]),
+        ("limit=2", ["Task 1", "Task 2"]),
+        ("skip=3&limit=4", ["Task 4", "Task 5", "Task 6", "Task 7"]),
+    ],
+)
+async def test_list_tasks_pagination(
+    client: AsyncClient, query: str, expected_titles: list[str]
+) -> None:
+    """GET /tasks respects skip and limit, alone and combined."""
+    await seed_tasks(client, 10)
+
+    response = await client.get(f"/tasks?{query}")
     assert response.status_code == 200
-    data = response.json()
-    assert len(data) == 2
+    assert [task["title"] for task in response.json()] == expected_titles
 
 
-async def test_list_tasks_pagination_skip_and_limit(client: AsyncClient) -> None:
-    """GET /tasks respects both skip and limit parameters."""
-    # Create 10 tasks
-    for i in range(10):
-        await client.post("/tasks", json={"title": f"Task {i+1}"})
+async def test_list_tasks_keyset_pagination(client: AsyncClient) -> None:
+    """GET /tasks?after_id= pages through all tasks in ID order."""
+    seeded = await seed_tasks(client, 5)
 
-    # Skip 3, limit 4
-    response = await client.get("/tasks?skip=3&limit=4")
-    assert response.status_code == 200
-    data = response.json()
-    assert len(data) == 4
+    pages = []
+    after_id = 0
+    while True:
+        response = await client.get(f"/tasks?limit=2&after_id={after_id}")
+        assert response.status_code == 200
+        page = response.json()
+        if not page:
+            break
+        pages.append([task["id"] for task in page])
+        after_id = page[-1]["id"]
+
+    ids = [task["id"] for task in seeded]
+    assert pages == [ids[0:2], ids[2:4], ids[4:5]]
 
 
 async def test_list_tasks_filter_completed_true(client: AsyncClient) -> None:
@@ -229,36 +246,6 @@ async def test_list_tasks_no_filter_returns_all(client: AsyncClient) -> None:
     assert len(data) == 2
 
 
-async def test_list_tasks_invalid_skip_negative_returns_422(
-    client: AsyncClient,
-) -> None:
-    """GET /tasks rejects negative skip value."""
-    response = await client.get("/tasks?skip=-1")
-    assert response.status_code == 422
-
-
-async def test_list_tasks_invalid_limit_zero_returns_422(client: AsyncClient) -> None:
-    """GET /tasks rejects limit=0."""
-    response = await client.get("/tasks?limit=0")
-    assert response.status_code == 422
-
-
-async def test_list_tasks_invalid_limit_too_large_returns_422(
-    client: AsyncClient,
-) -> None:
-    """GET /tasks rejects limit exceeding 1000."""
-    response = await client.get("/tasks?limit=1001")
-    assert response.status_code == 422
-
-
-async def test_list_tasks_invalid_limit_negative_returns_422(
-    client: AsyncClient,
-) -> None:
-    """GET /tasks rejects negative limit value."""
-    response = await client.get("/tasks?limit=-1")
-    assert response.status_code == 422
-
-
 async def test_list_tasks_skip_exceeds_total_returns_empty(client: AsyncClient) -> None:
     """GET /tasks returns empty list when skip exceeds total tasks."""
     await client.post("/tasks", json={"title": "Only task"})
@@ -268,49 +255,23 @@ async def test_list_tasks_skip_exceeds_total_returns_empty(client: AsyncClient)
     assert response.json() == []
 
 
-async def test_list_tasks_invalid_completed_value_returns_422(
-    client: AsyncClient,
-) -> None:
-    """GET /tasks rejects invalid completed parameter value."""
-    response = await client.get("/tasks?completed=maybe")
-    assert response.status_code == 422
-
-
 # ---------------------------------------------------------------------------
 # GET /tasks/{task_id} - Get Single Task
 # ---------------------------------------------------------------------------
 
 
-async def test_get_task_success(client: AsyncClient) -> None:
+async def test_get_task_success(client: AsyncClient, created_task: dict) -> None:
     """GET /tasks/{id} returns the correct task."""
-    created = await client.post(
-        "/tasks",
-        json={"title": "Fetch me", "description": "Test description"},
-    )
-    task_id = created.json()["id"]
-
-    response = await client.get(f"/tasks/{task_id}")
+    response = await client.get(f"/tasks/{created_task['id']}")
     assert response.status_code == 200
-    data = response.json()
-    assert data["id"] == task_id
-    assert data["title"] == "Fetch me"
-    assert data["description"] == "Test description"
-    assert data["completed"] is False
-    assert "created_at" in data
-    assert "updated_at" in data
+    assert response.json() == created_task
 
 
 async def test_get_task_not_found_returns_404(client: AsyncClient) -> None:
     """GET /tasks/{id} returns 404 for non-existent task."""
     response = await client.get("/tasks/99999")
     assert response.status_code == 404
-    assert "not found" in response.json()["detail"].lower()
-
-
-async def test_get_task_invalid_id_format_returns_422(client: AsyncClient) -> None:
-    """GET /tasks/{id} rejects non-integer task_id."""
-    response = await client.get("/tasks/abc")
-    assert response.status_code == 422
+    assert b"not found" in response.content.lower()
 
 
 async def test_get_task_zero_id_returns_404(client: AsyncClient) -> None:
@@ -319,27 +280,17 @@ async def test_get_task_zero_id_returns_404(client: AsyncClient) -> None:
     assert response.status_code == 404
 
 
-async def test_get_task_negative_id_returns_422(client: AsyncClient) -> None:
-    """GET /tasks/{id} rejects negative task_id."""
-    response = await client.get("/tasks/-1")
-    assert response.status_code == 422
-
-
 # ---------------------------------------------------------------------------
 # PATCH /tasks/{task_id} - Update Task
 # ---------------------------------------------------------------------------
 
 
-async def test_update_task_success_partial(client: AsyncClient) -> None:
+async def test_update_task_success_partial(
+    client: AsyncClient, created_task: dict
+) -> None:
     """PATCH /tasks/{id} applies partial updates successfully."""
-    created = await client.post(
-        "/tasks",
-        json={"title": "Original title", "description": "Original desc"},
-    )
-    task_id = created.json()["id"]
-
     response = await client.patch(
-        f"/tasks/{task_id}",
+        f"/tasks/{created_task['id']}",
         json={"title": "Updated title"},
     )
     assert response.status_code == 200
@@ -349,16 +300,12 @@ async def test_update_task_success_partial(client: AsyncClient) -> None:
     assert data["completed"] is False  # Unchanged
 
 
-async def test_update_task_success_all_fields(client: AsyncClient) -> None:
+async def test_update_task_success_all_fields(
+    client: AsyncClient, created_task: dict
+) -> None:
     """PATCH /tasks/{id} updates all provided fields."""
-    created = await client.post(
-        "/tasks",
-        json={"title": "Original", "description": "Original desc"},
-    )
-    task_id = created.json()["id"]
-
     response = await client.patch(
-        f"/tasks/{task_id}",
+        f"/tasks/{created_task['id']}",
         json={"title": "Updated", "description": "Updated desc", "completed": True},
     )
     assert response.status_code == 200
@@ -368,60 +315,51 @@ async def test_update_task_success_all_fields(client: AsyncClient) -> None:
     assert data["completed"] is True
 
 
-async def test_update_task_title_only(client: AsyncClient) -> None:
+async def test_update_task_title_only(client: AsyncClient, created_task: dict) -> None:
     """PATCH /tasks/{id} updates only title field."""
-    created = await client.post(
-        "/tasks",
-        json={"title": "Original", "description": "Keep this"},
+    response = await client.patch(
+        f"/tasks/{created_task['id']}", json={"title": "New title"}
     )
-    task_id = created.json()["id"]
-
-    response = await client.patch(f"/tasks/{task_id}", json={"title": "New title"})
     assert response.status_code == 200
     data = response.json()
     assert data["title"] == "New title"
-    assert data["description"] == "Keep this"
+    assert data["description"] == created_task["description"]
 
 
-async def test_update_task_description_only(client: AsyncClient) -> None:
+async def test_update_task_description_only(
+    client: AsyncClient, created_task: dict
+) -> None:
     """PATCH /tasks/{id} updates only description field."""
-    created = await client.post(
-        "/tasks",
-        json={"title": "Keep this", "description": "Original"},
-    )
-    task_id = created.json()["id"]
-
     response = await client.patch(
-        f"/tasks/{task_id}",
+        f"/tasks/{created_task['id']}",
         json={"description": "New description"},
     )
     assert response.status_code == 200
     data = response.json()
-    assert data["title"] == "Keep this"
+    assert data["title"] == created_task["title"]
     assert data["description"] == "New description"
 
 
-async def test_update_task_completed_only(client: AsyncClient) -> None:
+async def test_update_task_completed_only(
+    client: AsyncClient, created_task: dict
+) -> None:
     """PATCH /tasks/{id} updates only completed field."""
-    created = await client.post("/tasks", json={"title": "Task"})
-    task_id = created.json()["id"]
-
-    response = await client.patch(f"/tasks/{task_id}", json={"completed": True})
+    response = await client.patch(
+        f"/tasks/{created_task['id']}", json={"completed": True}
+    )
     assert response.status_code == 200
     data = response.json()
     assert data["completed"] is True
-    assert data["title"] == "Task"
+    assert data["title"] == created_task["title"]
 
 
-async def test_update_task_set_description_to_null(client: AsyncClient) -> None:
+async def test_update_task_set_description_to_null(
+    client: AsyncClient, created_task: dict
+) -> None:
     """PATCH /tasks/{id} can set description to null."""
-    created = await client.post(
-        "/tasks",
-        json={"title": "Task", "description": "Has description"},
+    response = await client.patch(
+        f"/tasks/{created_task['id']}", json={"description": None}
     )
-    task_id = created.json()["id"]
-
-    response = await client.patch(f"/tasks/{task_id}", json={"description": None})
     assert response.status_code == 200
     data = response.json()
     assert data["description"] is None
@@ -431,75 +369,16 @@ async def test_update_task_not_found_returns_404(client: AsyncClient) -> None:
     """PATCH /tasks/{id} returns 404 for non-existent task."""
     response = await client.patch("/tasks/99999", json={"title": "Updated"})
     assert response.status_code == 404
-    assert "not found" in response.json()["detail"].lower()
-
-
-async def test_update_task_empty_title_returns_422(client: AsyncClient) -> None:
-    """PATCH /tasks/{id} rejects empty title string."""
-    created = await client.post("/tasks", json={"title": "Valid task"})
-    task_id = created.json()["id"]
-
-    response = await client.patch(f"/tasks/{task_id}", json={"title": ""})
-    assert response.status_code == 422
-
-
-async def test_update_task_title_too_long_returns_422(client: AsyncClient) -> None:
-    """PATCH /tasks/{id} rejects title exceeding 255 characters."""
-    created = await client.post("/tasks", json={"title": "Valid task"})
-    task_id = created.json()["id"]
-
-    long_title = "a" * 256
-    response = await client.patch(f"/tasks/{task_id}", json={"title": long_title})
-    assert response.status_code == 422
-
-
-async def test_update_task_description_too_long_returns_422(
-    client: AsyncClient,
-) -> None:
-    """PATCH /tasks/{id} rejects description exceeding 1000 characters."""
-    created = await client.post("/tasks", json={"title": "Valid task"})
-    task_id = created.json()["id"]
-
-    long_description = "a" * 1001
-    response = await client.patch(
-        f"/tasks/{task_id}",
-        json={"description": long_description},
-    )
-    assert response.status_code == 422
+    assert b"not found" in response.content.lower()
 
 
-async def test_update_task_title_whitespace_only_returns_422(
-    client: AsyncClient,
+async def test_update_task_empty_json_succeeds(
+    client: AsyncClient, created_task: dict
 ) -> None:
-    """PATCH /tasks/{id} rejects title with only whitespace."""
-    created = await client.post("/tasks", json={"title": "Valid task"})
-    task_id = created.json()["id"]
-
-    response = await client.patch(f"/tasks/{task_id}", json={"title": "   \t\n  "})
-    assert response.status_code == 422
-
-
-async def test_update_task_empty_json_succeeds(client: AsyncClient) -> None:
     """PATCH /tasks/{id} accepts empty JSON body (no-op update)."""
-    created = await client.post("/tasks", json={"title": "Original"})
-    task_id = created.json()["id"]
-    original_data = created.json()
-
-    response = await client.patch(f"/tasks/{task_id}", json={})
+    response = await client.patch(f"/tasks/{created_task['id']}", json={})
     assert response.status_code == 200
-    data = response.json()
-    assert data["title"] == original_data["title"]
-
-
-async def test_update_task_invalid_completed_type_returns_422(
-    client: AsyncClient,
-) -> None:
-    """PATCH /tasks/{id} rejects invalid completed value type."""
-    created = await client.post("/tasks", json={"title": "Task"})
-    task_id = created.json()["id"]
-
-    response = await client.patch(f"/tasks/{task_id}", json={"completed": "yes"})
-    assert response.status_code == 422
+    assert response.json() == created_task
 
 
 # ---------------------------------------------------------------------------
@@ -507,14 +386,14 @@ async def test_update_task_invalid_completed_type_returns_422(
 # ---------------------------------------------------------------------------
 
 
-async def test_delete_task_success_returns_204(client: AsyncClient) -> None:
+async def test_delete_task_success_returns_204(
+    client: AsyncClient, created_task: dict
+) -> None:
     """DELETE /tasks/{id} removes the task and returns 204."""
-    created = await client.post("/tasks", json={"title": "To be deleted"})
-    task_id = created.json()["id"]
+    task_id = created_task["id"]
 
     response = await client.delete(f"/tasks/{task_id}")
     assert response.status_code == 204
-    assert response.content == b""  # 204 should have no body
 
     # Confirm it is gone
     get_response = await client.get(f"/tasks/{task_id}")
@@ -525,19 +404,14 @@ async def test_delete_task_not_found_returns_404(client: AsyncClient) -> None:
     """DELETE /tasks/{id} returns 404 for non-existent task."""
     response = await client.delete("/tasks/99999")
     assert response.status_code == 404
-    assert "not found" in response.json()["detail"].lower()
+    assert b"not found" in response.content.lower()
 
 
-async def test_delete_task_invalid_id_format_returns_422(client: AsyncClient) -> None:
-    """DELETE /tasks/{id} rejects non-integer task_id."""
-    response = await client.delete("/tasks/abc")
-    assert response.status_code == 422
-
-
-async def test_delete_task_already_deleted_returns_404(client: AsyncClient) -> None:
+async def test_delete_task_already_deleted_returns_404(
+    client: AsyncClient, created_task: dict
+) -> None:
     """DELETE /tasks/{id} returns 404 when deleting already deleted task."""
-    created = await client.post("/tasks", json={"title": "Task"})
-    task_id = created.json()["id"]
+    task_id = created_task["id"]
 
     # Delete once
     response1 = await client.delete(f"/tasks/{task_id}")
@@ -0,0 +1,219 @@
+"""Request validation tests for the /tasks endpoints.
+
+Every request here is rejected with 422 before a route handler runs, so no
+database is involved. They use a plain synchronous TestClient without the DB
+fixtures the integration tests in test_tasks.py rely on.
+"""
+
+from collections.abc import Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.main import app, rate_limiter
+
+client = TestClient(app)
+
+# One character past each schema limit, and a title that strips to "".
+_LONG_TITLE = "a" * 256
+_LONG_DESCRIPTION = "a" * 1001
+_WHITESPACE_TITLE = "   \t\n  "
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limit() -> Iterator[None]:
+    """Keep these requests out of the shared in-process rate limiter."""
+    app.dependency_overrides[rate_limiter] = lambda: None
+    yield
+    app.dependency_overrides.pop(rate_limiter, None)
+
+
+# ---------------------------------------------------------------------------
+# POST /tasks - Create Task
+# ---------------------------------------------------------------------------
+
+
+def test_create_task_missing_title_returns_422() -> None:
+    """POST /tasks rejects request with missing title field."""
+    response = client.post("/tasks", json={"description": "No title"})
+    assert response.status_code == 422
+    error_detail = response.json()["detail"]
+    assert any("title" in str(err).lower() for err in error_detail)
+
+
+def test_create_task_empty_title_returns_422() -> None:
+    """POST /tasks rejects an empty title string."""
+    response = client.post("/tasks", json={"title": ""})
+    assert response.status_code == 422
+    error_detail = response.json()["detail"]
+    assert any("title" in str(err).lower() for err in error_detail)
+
+
+def test_create_task_title_too_long_returns_422() -> None:
+    """POST /tasks rejects title exceeding 255 characters."""
+    response = client.post("/tasks", json={"title": _LONG_TITLE})
+    assert response.status_code == 422
+    error_detail = response.json()["detail"]
+    assert any(
+        "title" in str(err).lower() or "length" in str(err).lower()
+        for err in error_detail
+    )
+
+
+def test_create_task_description_too_long_returns_422() -> None:
+    """POST /tasks rejects description exceeding 1000 characters."""
+    response = client.post(
+        "/tasks", json={"title": "Valid title", "description": _LONG_DESCRIPTION}
+    )
+    assert response.status_code == 422
+    error_detail = response.json()["detail"]
+    assert any(
+        "description" in str(err).lower() or "length" in str(err).lower()
+        for err in error_detail
+    )
+
+
+def test_create_task_title_whitespace_only_returns_422() -> None:
+    """POST /tasks rejects title with only whitespace characters."""
+    response = client.post("/tasks", json={"title": _WHITESPACE_TITLE})
+    assert response.status_code == 422
+    # After stripping, empty string violates min_length=1
+
+
+def test_create_task_unknown_field_returns_422() -> None:
+    """POST /tasks rejects fields that are not part of the schema."""
+    response = client.post("/tasks", json={"title": "Task", "completed": True})
+    assert response.status_code == 422
+
+
+def test_create_task_empty_json_returns_422() -> None:
+    """POST /tasks rejects empty JSON body."""
+    response = client.post("/tasks", json={})
+    assert response.status_code == 422
+
+
+def test_create_task_invalid_json_returns_422() -> None:
+    """POST /tasks rejects invalid JSON structure."""
+    response = client.post("/tasks", json={"title": None})
+    assert response.status_code == 422
+
+
+# ---------------------------------------------------------------------------
+# POST /tasks/bulk - Create Tasks
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("count", [0, 101])
+def test_create_tasks_bulk_size_out_of_range_returns_422(count: int) -> None:
+    """POST /tasks/bulk accepts between 1 and 100 tasks."""
+    response = client.post(
+        "/tasks/bulk", json=[{"title": "Task"} for _ in range(count)]
+    )
+    assert response.status_code == 422
+
+
+# ---------------------------------------------------------------------------
+# GET /tasks - List Tasks
+# ---------------------------------------------------------------------------
+
+
+def test_list_tasks_invalid_skip_negative_returns_422() -> None:
+    """GET /tasks rejects negative skip value."""
+    response = client.get("/tasks?skip=-1")
+    assert response.status_code == 422
+
+
+def test_list_tasks_invalid_limit_zero_returns_422() -> None:
+    """GET /tasks rejects limit=0."""
+    response = client.get("/tasks?limit=0")
+    assert response.status_code == 422
+
+
+def test_list_tasks_invalid_limit_too_large_returns_422() -> None:
+    """GET /tasks rejects limit exceeding 1000."""
+    response = client.get("/tasks?limit=1001")
+    assert response.status_code == 422
+
+
+def test_list_tasks_invalid_limit_negative_returns_422() -> None:
+    """GET /tasks rejects negative limit value."""
+    response = client.get("/tasks?limit=-1")
+    assert response.status_code == 422
+
+
+def test_list_tasks_invalid_after_id_negative_returns_422() -> None:
+    """GET /tasks rejects a negative after_id cursor."""
+    response = client.get("/tasks?after_id=-1")
+    assert response.status_code == 422
+
+
+def test_list_tasks_invalid_completed_value_returns_422() -> None:
+    """GET /tasks rejects invalid completed parameter value."""
+    response = client.get("/tasks?completed=maybe")
+    assert response.status_code == 422
+
+
+# ---------------------------------------------------------------------------
+# GET /tasks/{task_id} - Get Single Task
+# ---------------------------------------------------------------------------
+
+
+def test_get_task_invalid_id_format_returns_422() -> None:
+    """GET /tasks/{id} rejects non-integer task_id."""
+    response = client.get("/tasks/abc")
+    assert response.status_code == 422
+
+
+def test_get_task_negative_id_returns_422() -> None:
+    """GET /tasks/{id} rejects negative task_id."""
+    response = client.get("/tasks/-1")
+    assert response.status_code == 422
+
+
+# ---------------------------------------------------------------------------
+# PATCH /tasks/{task_id} - Update Task
+# ---------------------------------------------------------------------------
+
+
+def test_update_task_empty_title_returns_422() -> None:
+    """PATCH /tasks/{id} rejects empty title string."""
+    response = client.patch("/tasks/1", json={"title": ""})
+    assert response.status_code == 422
+
+
+def test_update_task_title_too_long_returns_422() -> None:
+    """PATCH /tasks/{id} rejects title exceeding 255 characters."""
+    response = client.patch("/tasks/1", json={"title": _LONG_TITLE})
+    assert response.status_code == 422
+
+
+def test_update_task_description_too_long_returns_422() -> None:
+    """PATCH /tasks/{id} rejects description exceeding 1000 characters."""
+    response = client.patch(
+        "/tasks/1",
+        json={"description": _LONG_DESCRIPTION},
+    )
+    assert response.status_code == 422
+
+
+def test_update_task_title_whitespace_only_returns_422() -> None:
+    """PATCH /tasks/{id} rejects title with only whitespace."""
+    response = client.patch("/tasks/1", json={"title": _WHITESPACE_TITLE})
+    assert response.status_code == 422
+
+
+def test_update_task_invalid_completed_type_returns_422() -> None:
+    """PATCH /tasks/{id} rejects invalid completed value type."""
+    response = client.patch("/tasks/1", json={"completed": "yes"})
+    assert response.status_code == 422
+
+
+# ---------------------------------------------------------------------------
+# DELETE /tasks/{task_id} - Delete Task
+# ---------------------------------------------------------------------------
+
+
+def test_delete_task_invalid_id_format_returns_422() -> None:
+    """DELETE /tasks/{id} rejects non-integer task_id."""
+    response = client.delete("/tasks/abc")
+    assert response.status_code == 422